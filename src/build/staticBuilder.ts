@@ -9,7 +9,7 @@ import * as fs from 'fs';
 import * as path from 'path';
 import { parseRstDocument } from '../renderer/rstFullParser';
 import { renderDocument } from '../renderer/htmlEmitter';
-import { RenderContext } from '../renderer/directiveRenderer';
+import { RenderContext, buildIncomingLinks } from '../renderer/directiveRenderer';
 import { buildTocTree, getNavLinks, TocTree } from '../renderer/tocBuilder';
 import { renderPage, PageTemplateContext } from './templateEngine';
 import { copyStaticAssets, copyImages } from './assetCopier';
@@ -88,6 +88,9 @@ export function buildStaticSite(options: BuildOptions): BuildResult {
     errors.push(`Asset copy failed: ${err instanceof Error ? err.message : String(err)}`);
   }
 
+  // The index does not change during the build, so invert its links once for all pages
+  const incomingLinks = index ? buildIncomingLinks(index) : undefined;
+
   // Render each document
   for (let i = 0; i < tocTree.order.length; i++) {
     const slug = tocTree.order[i];
@@ -109,6 +112,7 @@ export function buildStaticSite(options: BuildOptions): BuildResult {
         index,
         basePath: sourceDir,
         currentSlug: slug,
+        incomingLinks,
       };
 
       const bodyHtml = renderDocument(doc, ctx);
@@ -12,6 +12,7 @@ import {
   getObjectTypeValues,
   getLevelValues,
   getLinkOptionNames,
+  getLinkOptionSet,
   getStatusNames,
   getObjectTypeInfo,
   getLevelInfo,
@@ -77,6 +78,26 @@ describe('Configuration Defaults', () => {
     });
   });
 
+  describe('getLinkOptionSet', () => {
+    it('should contain the same names as getLinkOptionNames', () => {
+      const options = getLinkOptionSet(DEFAULT_CONFIG);
+
+      expect([...options].sort()).toEqual(getLinkOptionNames(DEFAULT_CONFIG).sort());
+    });
+
+    it('should reuse the set for the same config object', () => {
+      expect(getLinkOptionSet(DEFAULT_CONFIG)).toBe(getLinkOptionSet(DEFAULT_CONFIG));
+    });
+
+    it('should compute a new set for a reloaded config', () => {
+      const reloaded = { ...DEFAULT_CONFIG, linkTypes: [{ option: 'traces', incoming: 'traced_by', outgoing: 'traces' }] };
+      const options = getLinkOptionSet(reloaded);
+
+      expect(options.has('traced_by')).toBe(true);
+      expect(options.has('satisfies')).toBe(false);
+    });
+  });
+
   describe('getStatusNames', () => {
     it('should return all status names', () => {
       const statuses = getStatusNames(DEFAULT_CONFIG);
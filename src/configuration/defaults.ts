@@ -157,6 +157,23 @@ export function getLinkOptionNames(config: PreceptConfig): string[] {
   return Array.from(options);
 }
 
+/** Link option sets, computed once per loaded configuration object */
+const linkOptionSets = new WeakMap<PreceptConfig, ReadonlySet<string>>();
+
+/**
+ * Get all valid link option names as a shared, read-only set.
+ * Callers that test option keys per directive should use this instead of
+ * building a new set from getLinkOptionNames() every time.
+ */
+export function getLinkOptionSet(config: PreceptConfig): ReadonlySet<string> {
+  let options = linkOptionSets.get(config);
+  if (!options) {
+    options = new Set(getLinkOptionNames(config));
+    linkOptionSets.set(config, options);
+  }
+  return options;
+}
+
 /**
  * Get all valid status names from configuration
  */
@@ -30,6 +30,18 @@ export function createEmptyIndex(): RequirementIndex {
   };
 }
 
+/**
+ * Get the ID set stored under `key`, creating it on first use (one lookup on the hot path)
+ */
+function getOrCreateSet(map: Map<string, Set<string>>, key: string): Set<string> {
+  let ids = map.get(key);
+  if (!ids) {
+    ids = new Set();
+    map.set(key, ids);
+  }
+  return ids;
+}
+
 /**
  * Add a requirement to the index
  */
@@ -38,55 +50,35 @@ function addToIndex(index: RequirementIndex, req: RequirementObject): void {
   index.objects.set(req.id, req);
 
   // Add to file index
-  if (!index.fileIndex.has(req.location.file)) {
-    index.fileIndex.set(req.location.file, new Set());
-  }
-  index.fileIndex.get(req.location.file)!.add(req.id);
+  getOrCreateSet(index.fileIndex, req.location.file).add(req.id);
 
   // Add to type index
-  if (!index.typeIndex.has(req.type)) {
-    index.typeIndex.set(req.type, new Set());
-  }
-  index.typeIndex.get(req.type)!.add(req.id);
+  getOrCreateSet(index.typeIndex, req.type).add(req.id);
 
   // Add to level index
   if (req.level) {
-    if (!index.levelIndex.has(req.level)) {
-      index.levelIndex.set(req.level, new Set());
-    }
-    index.levelIndex.get(req.level)!.add(req.id);
+    getOrCreateSet(index.levelIndex, req.level).add(req.id);
   }
 
   // Add to status index
   if (req.status) {
-    if (!index.statusIndex.has(req.status)) {
-      index.statusIndex.set(req.status, new Set());
-    }
-    index.statusIndex.get(req.status)!.add(req.id);
+    getOrCreateSet(index.statusIndex, req.status).add(req.id);
   }
 
   // Add to link graph
-  if (!index.linkGraph.has(req.id)) {
-    index.linkGraph.set(req.id, new Set());
-  }
-  for (const linkedIds of Object.values(req.links)) {
-    for (const linkedId of linkedIds) {
-      index.linkGraph.get(req.id)!.add(linkedId);
+  const linked = getOrCreateSet(index.linkGraph, req.id);
+  for (const linkType in req.links) {
+    for (const linkedId of req.links[linkType]) {
+      linked.add(linkedId);
 
       // Add reverse link
-      if (!index.linkGraph.has(linkedId)) {
-        index.linkGraph.set(linkedId, new Set());
-      }
-      index.linkGraph.get(linkedId)!.add(req.id);
+      getOrCreateSet(index.linkGraph, linkedId).add(req.id);
     }
   }
 
   // Add to baseline index
   if (req.baseline) {
-    if (!index.baselines.has(req.baseline)) {
-      index.baselines.set(req.baseline, new Set());
-    }
-    index.baselines.get(req.baseline)!.add(req.id);
+    getOrCreateSet(index.baselines, req.baseline).add(req.id);
   }
 }
 
@@ -5,10 +5,10 @@
 import * as vscode from 'vscode';
 import * as fs from 'fs';
 import * as path from 'path';
-import { RequirementObject, RequirementReference } from '../types';
+import { PreceptConfig, RequirementObject, RequirementReference } from '../types';
 import { IndexBuilder } from './indexBuilder';
 
-const CACHE_VERSION = 1;
+const CACHE_VERSION = 2;
 const CACHE_FILENAME = 'requirements-index.json';
 
 interface CacheData {
@@ -19,11 +19,24 @@ interface CacheData {
   references: Array<[string, RequirementReference[]]>;
 }
 
+/**
+ * Select the parts of the config that affect parsed index contents.
+ * Display-only settings (titles, colors, statuses, custom fields) are left
+ * out, so editing them does not throw away the cached index.
+ */
+function getIndexedConfig(config: PreceptConfig): unknown {
+  return {
+    linkTypes: config.linkTypes.map(lt => [lt.option, lt.incoming, lt.outgoing]),
+    // RegExp serializes to {} in JSON, so hash its source instead
+    idRegex: config.id_regex.source,
+  };
+}
+
 /**
  * Simple hash function for config comparison
  */
-function hashConfig(config: unknown): string {
-  const str = JSON.stringify(config);
+function hashConfig(config: PreceptConfig): string {
+  const str = JSON.stringify(getIndexedConfig(config));
   let hash = 0;
   for (let i = 0; i < str.length; i++) {
     const char = str.charCodeAt(i);
@@ -47,7 +60,7 @@ function getCacheFilePath(workspaceRoot: string): string {
 export async function saveIndexCache(
   workspaceRoot: string,
   indexBuilder: IndexBuilder,
-  config: unknown
+  config: PreceptConfig
 ): Promise<void> {
   try {
     const cacheData: CacheData = {
@@ -65,9 +78,11 @@ export async function saveIndexCache(
       await fs.promises.mkdir(vscodePath, { recursive: true });
     }
 
+    // Written compactly: the file is machine-read only, and indentation
+    // inflates both its size and the stringify/parse time on large projects
     await fs.promises.writeFile(
       cachePath,
-      JSON.stringify(cacheData, null, 2),
+      JSON.stringify(cacheData),
       'utf-8'
     );
   } catch (error) {
@@ -82,7 +97,7 @@ export async function saveIndexCache(
 export async function loadIndexCache(
   workspaceRoot: string,
   indexBuilder: IndexBuilder,
-  config: unknown
+  config: PreceptConfig
 ): Promise<boolean> {
   try {
     const cachePath = getCacheFilePath(workspaceRoot);
@@ -158,13 +173,13 @@ export class IndexCacheManager {
   private saveTimer: NodeJS.Timeout | null = null;
   private workspaceRoot: string;
   private indexBuilder: IndexBuilder;
-  private config: unknown;
+  private config: PreceptConfig;
   private disposable: vscode.Disposable | null = null;
 
   constructor(
     workspaceRoot: string,
     indexBuilder: IndexBuilder,
-    config: unknown
+    config: PreceptConfig
   ) {
     this.workspaceRoot = workspaceRoot;
     this.indexBuilder = indexBuilder;
@@ -179,10 +194,13 @@ export class IndexCacheManager {
   /**
    * Update configuration
    */
-  public updateConfig(config: unknown): void {
+  public updateConfig(config: PreceptConfig): void {
+    const indexedConfigChanged = hashConfig(config) !== hashConfig(this.config);
     this.config = config;
-    // Invalidate cache when config changes
-    clearIndexCache(this.workspaceRoot);
+    // Invalidate cache only when the change affects parsed index contents
+    if (indexedConfigChanged) {
+      clearIndexCache(this.workspaceRoot);
+    }
   }
 
   /**
@@ -9,7 +9,7 @@ import {
   PreceptConfig,
   SourceLocation,
 } from '../types';
-import { getLinkOptionNames } from '../configuration/defaults';
+import { getLinkOptionNames, getLinkOptionSet } from '../configuration/defaults';
 
 // Regex patterns for RST parsing
 const ITEM_DIRECTIVE_REGEX = /^\.\.\s+item::\s*(.*)$/;
@@ -18,6 +18,10 @@ const CODE_DIRECTIVE_REGEX = /^\.\.\s+code::\s*(.*)$/;
 const OPTION_REGEX = /^\s+:(\w+):\s*(.*)$/;
 const INLINE_ITEM_REGEX = /:item:`([^`]+)`/g;
 const INDENT_REGEX = /^(\s+)/;
+const ID_LIST_SEPARATOR = /[,\s]+/;
+
+// Reserved options that are not stored in metadata
+const RESERVED_OPTIONS: ReadonlySet<string> = new Set(['id', 'type', 'level', 'status', 'baseline']);
 
 type DirectiveType = 'item' | 'graphic' | 'code';
 
@@ -37,10 +41,14 @@ interface ParseState {
  * Parse IDs from a comma/space separated string
  */
 function parseIdList(value: string): string[] {
+  // The separator pattern consumes all whitespace, so only empty edge entries need dropping
   return value
-    .split(/[,\s]+/)
-    .map(id => id.trim())
-    .filter(id => id.length > 0);
+    .split(ID_LIST_SEPARATOR)
+    .filter(isNonEmpty);
+}
+
+function isNonEmpty(id: string): boolean {
+  return id.length > 0;
 }
 
 /**
@@ -122,15 +130,12 @@ function buildRequirement(
     return null;
   }
 
-  const linkOptions = new Set(getLinkOptionNames(config));
+  const linkOptions = getLinkOptionSet(config);
   const links: Record<string, string[]> = {};
   const metadata: Record<string, string> = {};
 
-  // Reserved options that are not stored in metadata
-  const reservedOptions = new Set(['id', 'type', 'level', 'status', 'baseline']);
-
   for (const [key, value] of state.currentOptions) {
-    if (reservedOptions.has(key)) {
+    if (RESERVED_OPTIONS.has(key)) {
       continue;
     }
     if (linkOptions.has(key)) {
@@ -218,7 +223,7 @@ function findLinkReferences(
   config: PreceptConfig
 ): RequirementReference[] {
   const references: RequirementReference[] = [];
-  const linkOptions = new Set(getLinkOptionNames(config));
+  const linkOptions = getLinkOptionSet(config);
 
   for (const [key, value] of options) {
     if (linkOptions.has(key)) {
@@ -430,6 +435,38 @@ export function parseRequirementAtLine(
   return null;
 }
 
+/**
+ * Patterns derived from a config for the cursor-position helpers below,
+ * which run on every hover, definition lookup and completion request
+ */
+interface PositionPatterns {
+  idRegex: RegExp;
+  linkOptionPatterns: RegExp[];
+}
+
+const positionPatterns = new WeakMap<PreceptConfig, PositionPatterns>();
+
+function getPositionPatterns(config: PreceptConfig): PositionPatterns {
+  let patterns = positionPatterns.get(config);
+  if (!patterns) {
+    patterns = {
+      idRegex: new RegExp(config.id_regex.source, 'g'),
+      linkOptionPatterns: getLinkOptionNames(config).map(option => new RegExp(`:${option}:\\s*`)),
+    };
+    positionPatterns.set(config, patterns);
+  }
+  return patterns;
+}
+
+/**
+ * Get the shared global ID regex for a config, reset to scan from the start of a line
+ */
+function getIdRegex(config: PreceptConfig): RegExp {
+  const { idRegex } = getPositionPatterns(config);
+  idRegex.lastIndex = 0;
+  return idRegex;
+}
+
 /**
  * Find requirement ID at a specific position in text
  */
@@ -438,8 +475,7 @@ export function findIdAtPosition(
   column: number,
   config: PreceptConfig
 ): string | null {
-  // Create a fresh regex for this search
-  const idRegex = new RegExp(config.id_regex.source, 'g');
+  const idRegex = getIdRegex(config);
 
   let match;
   while ((match = idRegex.exec(line)) !== null) {
@@ -459,7 +495,7 @@ export function findIdAtPosition(
  */
 export function getIdsInLine(line: string, config: PreceptConfig): string[] {
   const ids: string[] = [];
-  const idRegex = new RegExp(config.id_regex.source, 'g');
+  const idRegex = getIdRegex(config);
 
   let match;
   while ((match = idRegex.exec(line)) !== null) {
@@ -477,10 +513,7 @@ export function isInLinkContext(
   column: number,
   config: PreceptConfig
 ): boolean {
-  const linkOptions = getLinkOptionNames(config);
-
-  for (const option of linkOptions) {
-    const pattern = new RegExp(`:${option}:\\s*`);
+  for (const pattern of getPositionPatterns(config).linkOptionPatterns) {
     const match = line.match(pattern);
     if (match && match.index !== undefined) {
       const optionEnd = match.index + match[0].length;
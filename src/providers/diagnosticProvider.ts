@@ -6,7 +6,7 @@ import * as vscode from 'vscode';
 import { IndexBuilder } from '../indexing/indexBuilder';
 import { PreceptConfig, DiagnosticType, ValidationIssue } from '../types';
 import { parseRstFile, getIdsInLine } from '../indexing/rstParser';
-import { getStatusNames, getObjectTypeValues, getLinkOptionNames } from '../configuration/defaults';
+import { getStatusNames, getObjectTypeValues, getLinkOptionSet } from '../configuration/defaults';
 import { getValidationDebounceMs, isAutoValidationEnabled, isValidateOnSaveEnabled } from '../configuration/settingsManager';
 import * as fs from 'fs';
 
@@ -80,7 +80,7 @@ export function validateFile(
   const issues: ValidationIssue[] = [];
   const validStatuses = new Set(getStatusNames(config));
   const validObjectTypes = new Set(getObjectTypeValues(config));
-  const linkOptions = new Set(getLinkOptionNames(config));
+  const linkOptions = getLinkOptionSet(config);
 
   // Parse the file
   const parsed = parseRstFile(content, filePath, config);
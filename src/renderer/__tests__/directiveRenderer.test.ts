@@ -2,6 +2,7 @@ import {
   renderItemDirective,
   renderGraphicDirective,
   renderListingDirective,
+  buildIncomingLinks,
   RenderContext,
   escapeHtml,
   escapeAttr,
@@ -121,6 +122,47 @@ describe('directiveRenderer', () => {
       }
     });
 
+    it('should ignore empty entries in link lists', () => {
+      const rst = [
+        '.. item:: Sub Req',
+        '   :id: REQ-003',
+        '   :status: draft',
+        '   :satisfies: REQ-001, ,REQ-002,',
+      ].join('\n');
+
+      const node = parseRstDocument(rst).children[0];
+      if (node.type === 'item_directive') {
+        const html = renderItemDirective(node, makeCtx());
+        expect(html).toContain('href="#req-REQ-001"');
+        expect(html).toContain('href="#req-REQ-002"');
+        expect(html).not.toContain('href="#req-"');
+      }
+    });
+
+    it('should label outgoing links from the current config', () => {
+      const rst = [
+        '.. item:: Sub Req',
+        '   :id: REQ-002',
+        '   :type: requirement',
+        '   :status: draft',
+        '   :satisfies: REQ-001',
+      ].join('\n');
+
+      const doc = parseRstDocument(rst);
+      const node = doc.children[0];
+
+      if (node.type === 'item_directive') {
+        expect(renderItemDirective(node, makeCtx())).toContain('Satisfies');
+
+        const reloaded = makeCtx({
+          linkTypes: [{ option: 'satisfies', incoming: 'satisfied_by', outgoing: 'fulfils_need' }],
+        });
+        const html = renderItemDirective(node, reloaded);
+        expect(html).toContain('Fulfils Need');
+        expect(html).toContain('href="#req-REQ-001"');
+      }
+    });
+
     it('should render incoming link references from index', () => {
       const index: RequirementIndex = {
         objects: new Map<string, RequirementObject>([
@@ -172,6 +214,133 @@ describe('directiveRenderer', () => {
       }
     });
 
+    it('should resolve incoming links for each item rendered with one context', () => {
+      const obj = (id: string, satisfies: string[]): RequirementObject => ({
+        id,
+        title: id,
+        type: 'requirement',
+        status: 'draft',
+        description: '',
+        location: { file: 'test.rst', line: 1 },
+        links: { satisfies },
+        metadata: {},
+      });
+      const index: RequirementIndex = {
+        objects: new Map<string, RequirementObject>([
+          ['REQ-001', obj('REQ-001', ['REQ-001'])],
+          ['REQ-002', obj('REQ-002', [])],
+          ['REQ-003', obj('REQ-003', ['REQ-001', 'REQ-002', 'REQ-002'])],
+        ]),
+        fileIndex: new Map(),
+        typeIndex: new Map(),
+        levelIndex: new Map(),
+        statusIndex: new Map(),
+        linkGraph: new Map(),
+        baselines: new Map(),
+      };
+      const ctx = makeCtx(undefined, index);
+
+      const render = (id: string): string => {
+        const node = parseRstDocument(`.. item:: ${id}\n   :id: ${id}\n   :status: draft`).children[0];
+        return node.type === 'item_directive' ? renderItemDirective(node, ctx) : '';
+      };
+
+      const first = render('REQ-001');
+      expect(first).toContain('href="#req-REQ-003"');
+      expect(first).not.toContain('href="#req-REQ-001"');
+
+      const second = render('REQ-002');
+      expect(second.match(/href="#req-REQ-003"/g)).toHaveLength(1);
+
+      expect(render('REQ-003')).not.toContain('Satisfied By');
+    });
+
+    it('should use a shared incoming link map when one is provided', () => {
+      const child: RequirementObject = {
+        id: 'REQ-002',
+        title: 'Child',
+        type: 'requirement',
+        status: 'draft',
+        description: '',
+        location: { file: 'test.rst', line: 1 },
+        links: { satisfies: ['REQ-001'] },
+        metadata: {},
+      };
+      const index: RequirementIndex = {
+        objects: new Map([['REQ-002', child]]),
+        fileIndex: new Map(),
+        typeIndex: new Map(),
+        levelIndex: new Map(),
+        statusIndex: new Map(),
+        linkGraph: new Map(),
+        baselines: new Map(),
+      };
+      const incomingLinks = buildIncomingLinks(index);
+      expect(incomingLinks.get('REQ-001')?.get('satisfies')).toEqual(['REQ-002']);
+
+      const node = parseRstDocument('.. item:: Parent\n   :id: REQ-001\n   :status: draft').children[0];
+      if (node.type === 'item_directive') {
+        // Two page contexts over the same snapshot both read the shared map
+        for (const page of ['a', 'b']) {
+          const ctx: RenderContext = { ...makeCtx(undefined, index), currentSlug: page, incomingLinks };
+          expect(renderItemDirective(node, ctx)).toContain('href="#req-REQ-002"');
+        }
+      }
+    });
+
+    it('should label incoming links of unconfigured link types', () => {
+      const index: RequirementIndex = {
+        objects: new Map<string, RequirementObject>([
+          ['REQ-002', {
+            id: 'REQ-002',
+            title: 'Child',
+            type: 'requirement',
+            status: 'draft',
+            description: '',
+            location: { file: 'test.rst', line: 1 },
+            links: { depends_on: ['REQ-001'] },
+            metadata: {},
+          }],
+        ]),
+        fileIndex: new Map(),
+        typeIndex: new Map(),
+        levelIndex: new Map(),
+        statusIndex: new Map(),
+        linkGraph: new Map(),
+        baselines: new Map(),
+      };
+
+      const node = parseRstDocument('.. item:: Parent\n   :id: REQ-001\n   :status: draft').children[0];
+      if (node.type === 'item_directive') {
+        const html = renderItemDirective(node, makeCtx(undefined, index));
+        expect(html).toContain('Depends On (Incoming)');
+        expect(html).toContain('href="#req-REQ-002"');
+      }
+    });
+
+    it('should render custom field values with their configured titles', () => {
+      const rst = [
+        '.. item:: Widget Support',
+        '   :id: REQ-001',
+        '   :status: draft',
+        '   :product: widget-pro',
+        '   :priority: urgent',
+      ].join('\n');
+
+      const node = parseRstDocument(rst).children[0];
+      if (node.type === 'item_directive') {
+        const html = renderItemDirective(node, makeCtx({
+          customFields: {
+            product: [{ value: 'widget-pro', title: 'Widget Pro' }],
+            priority: [{ value: 'high', title: 'High' }],
+          },
+        }));
+        expect(html).toContain('Widget Pro');
+        expect(html).toContain('urgent');
+        expect(html.match(/<td>Product<\/td>/g)).toHaveLength(1);
+      }
+    });
+
     it('should render value for parameter items', () => {
       const rst = [
         '.. item:: Max Speed',
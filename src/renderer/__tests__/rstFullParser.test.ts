@@ -284,6 +284,42 @@ describe('rstFullParser', () => {
       }
     });
 
+    it('should not parse the body of a graphic with an image file', () => {
+      const rst = [
+        '.. graphic:: Architecture Diagram',
+        '   :id: FIG-001',
+        '   :file: images/arch.png',
+        '',
+        '   Placeholder text shown only without an image.',
+      ].join('\n');
+
+      const graphic = parseRstDocument(rst).children[0];
+      expect(graphic.type).toBe('graphic_directive');
+      if (graphic.type === 'graphic_directive') {
+        expect(graphic.content.length).toBeGreaterThan(0);
+        expect(graphic.plantuml).toBe(false);
+        expect(graphic.contentNodes).toHaveLength(0);
+      }
+    });
+
+    it('should flag PlantUML graphics without parsing their source', () => {
+      const rst = [
+        '.. graphic:: Sequence',
+        '   :id: FIG-002',
+        '',
+        '   @startuml',
+        '   A -> B: request',
+        '   @enduml',
+      ].join('\n');
+
+      const graphic = parseRstDocument(rst).children[0];
+      expect(graphic.type).toBe('graphic_directive');
+      if (graphic.type === 'graphic_directive') {
+        expect(graphic.plantuml).toBe(true);
+        expect(graphic.contentNodes).toHaveLength(0);
+      }
+    });
+
     it('should parse a listing directive', () => {
       const rst = [
         '.. listing:: Example Code',
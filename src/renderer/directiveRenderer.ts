@@ -9,15 +9,27 @@ import {
   ItemDirectiveNode,
   GraphicDirectiveNode,
   ListingDirectiveNode,
-  BlockNode,
 } from './rstNodes';
 import { PreceptConfig, RequirementIndex } from '../types';
 import { renderBlockNodes } from './htmlEmitter';
 import { encodePlantUml } from './plantumlRenderer';
-import hljs from 'highlight.js';
+import type hljsApi from 'highlight.js';
 
 const DEFAULT_PLANTUML_SERVER = 'https://www.plantuml.com/plantuml/svg/';
 
+/**
+ * Upper bound for each module-level memo cache. The caches live for the whole
+ * extension host session and are keyed by document text (labels, class lists,
+ * diagram sources), so they must not grow without limit while the user types.
+ */
+const MEMO_CACHE_LIMIT = 256;
+
+/** Encoded PlantUML sources, keyed by diagram text */
+const plantUmlEncodings = new Map<string, string>();
+
+/** Highlighted code block HTML, keyed by language and source */
+const highlightedCode = new Map<string, string>();
+
 /**
  * Context for rendering directives, providing access to config and index.
  */
@@ -30,6 +42,11 @@ export interface RenderContext {
   plantumlServer?: string;
   /** Current file path (relative slug, e.g. "stakeholder") for cross-file link resolution */
   currentSlug?: string;
+  /**
+   * Reverse link map of `index`, shared by renders that use the same index
+   * snapshot (e.g. every page of a static build). Built per context when omitted.
+   */
+  incomingLinks?: IncomingLinks;
 }
 
 // ---------------------------------------------------------------------------
@@ -37,39 +54,35 @@ export interface RenderContext {
 // ---------------------------------------------------------------------------
 
 export function renderItemDirective(node: ItemDirectiveNode, ctx: RenderContext): string {
-  const { config } = ctx;
-  const typeClass = `precept-type-${node.itemType}`;
-  const statusClass = `precept-status-${node.status}`;
+  const compiled = getCompiledConfig(ctx.config);
+  const wrapperClass = getWrapperClass(`precept-item precept-type-${node.itemType} precept-status-${node.status}`);
   const idAttr = node.id ? ` id="req-${escapeAttr(node.id)}"` : '';
 
-  const parts: string[] = [];
-  parts.push(`<div class="precept-item ${typeClass} ${statusClass}"${idAttr}>`);
-
-  // Title with ID on the left
-  parts.push('<p class="rubric precept-title">');
-  if (node.id) {
-    parts.push(`<span class="precept-title-id">${escapeHtml(node.id)}</span> `);
-  }
-  parts.push(`${escapeHtml(node.title)}</p>`);
-
-  // Content wrapper: body on left, metadata on right
-  parts.push('<div class="precept-content-wrapper">');
+  const parts: string[] = [
+    `<div class="${wrapperClass}"${idAttr}>`,
+    // Title with ID on the left
+    renderDirectiveTitle(node.id, node.title),
+    // Content wrapper: body on left, metadata on right
+    '<div class="precept-content-wrapper">',
+    '<div class="precept-body">',
+  ];
 
   // Body content
-  parts.push('<div class="precept-body">');
   if (node.contentNodes.length > 0) {
     parts.push(renderBlockNodes(node.contentNodes, ctx));
   }
   parts.push('</div>');
 
   // Metadata table
-  const rows = buildItemMetadataRows(node, config, ctx.index);
+  const rows = buildItemMetadataRows(node, compiled, getItemIncomingLinks(ctx, node.id));
   if (rows.length > 0) {
     parts.push(renderMetadataTable(rows));
   }
 
-  parts.push('</div>'); // precept-content-wrapper
-  parts.push('</div>'); // precept-item
+  parts.push(
+    '</div>', // precept-content-wrapper
+    '</div>', // precept-item
+  );
 
   return parts.join('\n');
 }
@@ -79,65 +92,57 @@ export function renderItemDirective(node: ItemDirectiveNode, ctx: RenderContext)
 // ---------------------------------------------------------------------------
 
 export function renderGraphicDirective(node: GraphicDirectiveNode, ctx: RenderContext): string {
-  const statusClass = `precept-status-${node.status}`;
+  const compiled = getCompiledConfig(ctx.config);
+  const wrapperClass = getWrapperClass(`precept-graphic precept-status-${node.status}`);
   const idAttr = node.id ? ` id="fig-${escapeAttr(node.id)}"` : '';
 
-  const parts: string[] = [];
-  parts.push(`<div class="precept-graphic ${statusClass}"${idAttr}>`);
-
-  // Title
-  parts.push('<p class="rubric precept-title">');
-  if (node.id) {
-    parts.push(`<span class="precept-title-id">${escapeHtml(node.id)}</span> `);
-  }
-  parts.push(`${escapeHtml(node.title || 'Graphic')}</p>`);
-
-  // Content wrapper
-  parts.push('<div class="precept-content-wrapper">');
-
-  // Body
-  parts.push('<div class="precept-body">');
+  const parts: string[] = [
+    `<div class="${wrapperClass}"${idAttr}>`,
+    renderDirectiveTitle(node.id, node.title || 'Graphic'),
+    '<div class="precept-content-wrapper">',
+    '<div class="precept-body">',
+  ];
 
   if (node.file) {
     // Image file
     const alt = escapeAttr(node.alt || node.title || 'Graphic');
     const scaleAttr = node.scale ? ` style="width:${escapeAttr(node.scale)}%"` : '';
-    parts.push(`<div class="precept-graphic-image precept-clickable">`);
-    parts.push(`<img src="${escapeAttr(node.file)}" alt="${alt}"${scaleAttr}>`);
-    parts.push('</div>');
-  } else if (node.content.length > 0) {
+    parts.push(
+      '<div class="precept-graphic-image precept-clickable">',
+      `<img src="${escapeAttr(node.file)}" alt="${alt}"${scaleAttr}>`,
+      '</div>',
+    );
+  } else if (node.plantuml) {
+    // PlantUML (detected by the parser) — render via server URL as inline <img>
     const contentText = node.content.join('\n');
-    if (contentText.includes('@startuml') || contentText.includes('@startmindmap') || contentText.includes('@startgantt')) {
-      // PlantUML — render via server URL as inline <img>
-      const server = ctx.plantumlServer || DEFAULT_PLANTUML_SERVER;
-      const encoded = encodePlantUml(contentText);
-      const imgUrl = server.endsWith('/') ? `${server}${encoded}` : `${server}/${encoded}`;
-      const alt = escapeAttr(node.alt || node.title || 'PlantUML diagram');
-      parts.push('<div class="precept-graphic-uml">');
-      parts.push(`<img src="${escapeAttr(imgUrl)}" alt="${alt}" class="plantuml-diagram">`);
-      parts.push('</div>');
-    } else if (node.contentNodes.length > 0) {
-      parts.push(renderBlockNodes(node.contentNodes, ctx));
-    }
+    const imgUrl = getPlantUmlUrl(ctx.plantumlServer || DEFAULT_PLANTUML_SERVER, contentText);
+    const alt = escapeAttr(node.alt || node.title || 'PlantUML diagram');
+    parts.push(
+      '<div class="precept-graphic-uml">',
+      `<img src="${escapeAttr(imgUrl)}" alt="${alt}" class="plantuml-diagram">`,
+      '</div>',
+    );
+  } else if (node.contentNodes.length > 0) {
+    parts.push(renderBlockNodes(node.contentNodes, ctx));
   }
 
   // Caption
   if (node.caption) {
-    parts.push('<div class="precept-graphic-caption">');
-    parts.push(`<p>${escapeHtml(node.caption)}</p>`);
-    parts.push('</div>');
+    parts.push('<div class="precept-graphic-caption">', `<p>${escapeHtml(node.caption)}</p>`, '</div>');
   }
 
   parts.push('</div>'); // precept-body
 
   // Metadata table
-  const rows = buildGraphicMetadataRows(node, ctx.config, ctx.index);
+  const rows = buildGraphicMetadataRows(node, compiled, getItemIncomingLinks(ctx, node.id));
   if (rows.length > 0) {
     parts.push(renderMetadataTable(rows));
   }
 
-  parts.push('</div>'); // precept-content-wrapper
-  parts.push('</div>'); // precept-graphic
+  parts.push(
+    '</div>', // precept-content-wrapper
+    '</div>', // precept-graphic
+  );
 
   return parts.join('\n');
 }
@@ -147,47 +152,39 @@ export function renderGraphicDirective(node: GraphicDirectiveNode, ctx: RenderCo
 // ---------------------------------------------------------------------------
 
 export function renderListingDirective(node: ListingDirectiveNode, ctx: RenderContext): string {
-  const statusClass = `precept-status-${node.status}`;
+  const compiled = getCompiledConfig(ctx.config);
+  const wrapperClass = getWrapperClass(`precept-code precept-status-${node.status}`);
   const idAttr = node.id ? ` id="code-${escapeAttr(node.id)}"` : '';
 
-  const parts: string[] = [];
-  parts.push(`<div class="precept-code ${statusClass}"${idAttr}>`);
-
-  // Title
-  parts.push('<p class="rubric precept-title">');
-  if (node.id) {
-    parts.push(`<span class="precept-title-id">${escapeHtml(node.id)}</span> `);
-  }
-  parts.push(`${escapeHtml(node.title || 'Code')}</p>`);
-
-  // Content wrapper
-  parts.push('<div class="precept-content-wrapper">');
+  const parts: string[] = [
+    `<div class="${wrapperClass}"${idAttr}>`,
+    renderDirectiveTitle(node.id, node.title || 'Code'),
+    '<div class="precept-content-wrapper">',
+    '<div class="precept-body">',
+  ];
 
   // Body: code block
-  parts.push('<div class="precept-body">');
   if (node.code) {
-    parts.push('<div class="precept-code-content">');
-    parts.push(highlightCode(node.code, node.language));
-    parts.push('</div>');
+    parts.push('<div class="precept-code-content">', highlightCode(node.code, node.language), '</div>');
   }
 
   // Caption
   if (node.caption) {
-    parts.push('<div class="precept-code-caption">');
-    parts.push(`<p>${escapeHtml(node.caption)}</p>`);
-    parts.push('</div>');
+    parts.push('<div class="precept-code-caption">', `<p>${escapeHtml(node.caption)}</p>`, '</div>');
   }
 
   parts.push('</div>'); // precept-body
 
   // Metadata table
-  const rows = buildListingMetadataRows(node, ctx.config, ctx.index);
+  const rows = buildListingMetadataRows(node, compiled, getItemIncomingLinks(ctx, node.id));
   if (rows.length > 0) {
     parts.push(renderMetadataTable(rows));
   }
 
-  parts.push('</div>'); // precept-content-wrapper
-  parts.push('</div>'); // precept-code
+  parts.push(
+    '</div>', // precept-content-wrapper
+    '</div>', // precept-code
+  );
 
   return parts.join('\n');
 }
@@ -196,246 +193,484 @@ export function renderListingDirective(node: ListingDirectiveNode, ctx: RenderCo
 // Metadata table construction
 // ---------------------------------------------------------------------------
 
-interface MetadataRow {
-  label: string;
-  value: string;
-  isLink: boolean;
-  cssClass?: string;
+/** Directive options rendered by dedicated rows or not shown in the table */
+const KNOWN_OPTIONS: ReadonlySet<string> = new Set([
+  'id', 'type', 'level', 'status', 'value', 'term', 'file', 'alt', 'scale', 'caption', 'language',
+]);
+
+/** Directive node fields that feed the shared metadata rows */
+interface MetadataSource {
+  id: string;
+  level: string;
+  status: string;
+  options: Record<string, string>;
 }
 
-function buildItemMetadataRows(node: ItemDirectiveNode, config: PreceptConfig, index?: RequirementIndex): MetadataRow[] {
-  const rows: MetadataRow[] = [];
-
-  // Type
-  const typeTitle = getTypeTitle(config, node.itemType);
-  rows.push({ label: 'Type', value: typeTitle, isLink: false });
+/**
+ * Build the metadata rows shared by all Precept directives.
+ * Rows are rendered to `<tr>` HTML as they are built.
+ *
+ * `typeRows` come first (Type, plus e.g. Language for listings) and
+ * `attributeRows` directly after Status (e.g. Value and Term for items).
+ */
+function buildMetadataRows(
+  node: MetadataSource,
+  compiled: CompiledRenderConfig,
+  incoming: ItemIncomingLinks | undefined,
+  typeRows: string[],
+  attributeRows: string[] = [],
+  includeCustomFields = false,
+): string[] {
+  const rows = typeRows;
 
-  // Level
   if (node.level) {
-    const levelTitle = getLevelTitle(config, node.level);
-    rows.push({ label: 'Level', value: levelTitle, isLink: false });
+    rows.push(textRow('Level', getLevelTitle(compiled, node.level)));
   }
 
-  // Status
-  rows.push({ label: 'Status', value: titleCase(node.status), isLink: false });
+  rows.push(textRow('Status', titleCase(node.status)));
+  rows.push(...attributeRows);
+
+  // Skeleton directives (only id/type/level/status) have no option-driven rows
+  if (hasOptionRows(node.options)) {
+    addLinkRows(rows, node.options, compiled);
+    addExtraOptionRows(rows, node.options, compiled);
+    if (includeCustomFields) {
+      addCustomFieldRows(rows, node.options, compiled);
+    }
+  }
+  addIncomingLinkRows(rows, compiled, incoming);
+
+  return rows;
+}
+
+/**
+ * Check whether any option could produce a link, extra-option or custom field row.
+ */
+function hasOptionRows(options: Record<string, string>): boolean {
+  for (const key in options) {
+    if (!KNOWN_OPTIONS.has(key)) return true;
+  }
+  return false;
+}
+
+function buildItemMetadataRows(
+  node: ItemDirectiveNode,
+  compiled: CompiledRenderConfig,
+  incoming?: ItemIncomingLinks,
+): string[] {
+  const attributeRows: string[] = [];
 
   // Value (for parameters)
   if (node.options.value) {
-    rows.push({ label: 'Value', value: node.options.value, isLink: false, cssClass: 'precept-value' });
+    attributeRows.push(textRow('Value', node.options.value, 'precept-value'));
   }
 
   // Term (for terminology)
   if (node.options.term) {
-    rows.push({ label: 'Term', value: node.options.term, isLink: false, cssClass: 'precept-term' });
+    attributeRows.push(textRow('Term', node.options.term, 'precept-term'));
   }
 
-  // Outgoing link fields
-  addLinkRows(rows, node.options, config);
+  const typeRows: string[] = [textRow('Type', getTypeTitle(compiled, node.itemType))];
+  return buildMetadataRows(node, compiled, incoming, typeRows, attributeRows, true);
+}
 
-  // Extra options
-  addExtraOptionRows(rows, node.options, config);
+function buildGraphicMetadataRows(
+  node: GraphicDirectiveNode,
+  compiled: CompiledRenderConfig,
+  incoming?: ItemIncomingLinks,
+): string[] {
+  const typeRows: string[] = [textRow('Type', 'Graphic')];
+  return buildMetadataRows(node, compiled, incoming, typeRows);
+}
 
-  // Custom fields
-  addCustomFieldRows(rows, node.options, config);
+function buildListingMetadataRows(
+  node: ListingDirectiveNode,
+  compiled: CompiledRenderConfig,
+  incoming?: ItemIncomingLinks,
+): string[] {
+  const typeRows: string[] = [textRow('Type', 'Code')];
 
-  // Incoming links
-  addIncomingLinkRows(rows, node.id, config, index);
+  if (node.language && node.language !== 'text') {
+    typeRows.push(textRow('Language', node.language, 'precept-language'));
+  }
 
-  return rows;
+  return buildMetadataRows(node, compiled, incoming, typeRows);
 }
 
-function buildGraphicMetadataRows(node: GraphicDirectiveNode, config: PreceptConfig, index?: RequirementIndex): MetadataRow[] {
-  const rows: MetadataRow[] = [];
+function addLinkRows(rows: string[], options: Record<string, string>, compiled: CompiledRenderConfig): void {
+  for (const [opt, label] of compiled.linkLabels) {
+    const value = options[opt];
+    if (!value) continue;
 
-  rows.push({ label: 'Type', value: 'Graphic', isLink: false });
+    const ids = splitLinkIds(value);
+    if (ids.length > 0) {
+      rows.push(linkRow(label, ids));
+    }
+  }
+}
 
-  if (node.level) {
-    rows.push({ label: 'Level', value: getLevelTitle(config, node.level), isLink: false });
+/**
+ * Split a comma-separated link option value into target IDs,
+ * dropping empty entries left by stray or trailing commas.
+ */
+function splitLinkIds(value: string): string[] {
+  const ids: string[] = [];
+  for (const part of value.split(',')) {
+    const id = part.trim();
+    if (id) ids.push(id);
   }
+  return ids;
+}
 
-  rows.push({ label: 'Status', value: titleCase(node.status), isLink: false });
+function addExtraOptionRows(
+  rows: string[],
+  options: Record<string, string>,
+  compiled: CompiledRenderConfig,
+): void {
+  // Extra options are not currently stored in PreceptConfig, but we can detect them
+  const { linkLabels, customFieldTitles } = compiled;
 
-  addLinkRows(rows, node.options, config);
-  addExtraOptionRows(rows, node.options, config);
-  addIncomingLinkRows(rows, node.id, config, index);
+  for (const key in options) {
+    if (KNOWN_OPTIONS.has(key)) continue;
+    // Skip link types (already handled)
+    if (linkLabels.has(key)) continue;
+    // Skip custom fields (handled separately)
+    if (customFieldTitles.has(key)) continue;
 
-  return rows;
+    rows.push(textRow(humanize(key), options[key]));
+  }
 }
 
-function buildListingMetadataRows(node: ListingDirectiveNode, config: PreceptConfig, index?: RequirementIndex): MetadataRow[] {
-  const rows: MetadataRow[] = [];
+function addCustomFieldRows(rows: string[], options: Record<string, string>, compiled: CompiledRenderConfig): void {
+  for (const [fieldName, valueTitles] of compiled.customFieldTitles) {
+    const value = options[fieldName];
+    if (value) {
+      rows.push(textRow(humanize(fieldName), valueTitles.get(value) ?? value));
+    }
+  }
+}
 
-  rows.push({ label: 'Type', value: 'Code', isLink: false });
+function addIncomingLinkRows(rows: string[], compiled: CompiledRenderConfig, incoming?: ItemIncomingLinks): void {
+  if (!incoming) return;
 
-  if (node.language && node.language !== 'text') {
-    rows.push({ label: 'Language', value: node.language, isLink: false, cssClass: 'precept-language' });
+  for (const [linkType, sourceIds] of incoming) {
+    const incomingLabel = getIncomingLabel(compiled, linkType);
+    rows.push(linkRow(incomingLabel, sourceIds));
   }
+}
 
-  if (node.level) {
-    rows.push({ label: 'Level', value: getLevelTitle(config, node.level), isLink: false });
-  }
+// ---------------------------------------------------------------------------
+// Shared HTML fragments
+// ---------------------------------------------------------------------------
 
-  rows.push({ label: 'Status', value: titleCase(node.status), isLink: false });
+/** Escaped wrapper class lists, keyed by the raw class list */
+const wrapperClasses = new Map<string, string>();
 
-  addLinkRows(rows, node.options, config);
-  addExtraOptionRows(rows, node.options, config);
-  addIncomingLinkRows(rows, node.id, config, index);
+/**
+ * Get the escaped `class` attribute value for a directive wrapper.
+ * A document only uses a handful of type/status combinations, so results are memoized.
+ */
+function getWrapperClass(rawClass: string): string {
+  return memoize(wrapperClasses, rawClass, escapeAttr);
+}
 
-  return rows;
+/**
+ * Render the rubric title shared by all Precept directives, with the ID on the left.
+ */
+function renderDirectiveTitle(id: string, title: string): string {
+  const idHtml = id ? `<span class="precept-title-id">${escapeHtml(id)}</span> \n` : '';
+  return `<p class="rubric precept-title">\n${idHtml}${escapeHtml(title)}</p>`;
 }
 
-function addLinkRows(rows: MetadataRow[], options: Record<string, string>, config: PreceptConfig): void {
-  const linkOptions = config.linkTypes.map(lt => lt.option).filter(Boolean);
+// ---------------------------------------------------------------------------
+// Metadata table HTML rendering
+// ---------------------------------------------------------------------------
 
-  for (const opt of linkOptions) {
-    if (options[opt]) {
-      let label = opt.replace(/_/g, ' ');
-      for (const lt of config.linkTypes) {
-        if (lt.option === opt) {
-          label = lt.outgoing.replace(/_/g, ' ');
-          break;
-        }
-      }
-      rows.push({ label: titleCase(label), value: options[opt], isLink: true });
-    }
-  }
+/** Static markup around the metadata rows, identical for every directive */
+const METADATA_TABLE_OPEN = [
+  '<div class="precept-metadata-wrapper">',
+  '<table class="precept-metadata-table">',
+  '<tbody>',
+].join('\n');
+const METADATA_TABLE_CLOSE = ['</tbody>', '</table>', '</div>'].join('\n');
+
+function renderMetadataTable(rows: string[]): string {
+  // Rows are complete <tr> strings already, so join them in one step
+  return `${METADATA_TABLE_OPEN}\n${rows.join('\n')}\n${METADATA_TABLE_CLOSE}`;
 }
 
-function addExtraOptionRows(rows: MetadataRow[], options: Record<string, string>, _config: PreceptConfig): void {
-  // Extra options are not currently stored in PreceptConfig, but we can detect them
-  const knownOptions = new Set(['id', 'type', 'level', 'status', 'value', 'term', 'file', 'alt', 'scale', 'caption', 'language']);
+/** `precept-field-*` cell classes, keyed by row label */
+const fieldClasses = new Map<string, string>();
 
-  for (const [key, value] of Object.entries(options)) {
-    if (knownOptions.has(key)) continue;
-    // Skip link types (already handled)
-    if (_config.linkTypes.some(lt => lt.option === key)) continue;
-    // Skip custom fields (handled separately)
-    if (key in _config.customFields) continue;
+/**
+ * Get the CSS class for a metadata value cell. Labels come from a small,
+ * fixed vocabulary (Type, Status, link labels, ...), so results are memoized.
+ */
+function getFieldClass(label: string): string {
+  return memoize(fieldClasses, label, toFieldClass);
+}
 
-    rows.push({ label: titleCase(key.replace(/_/g, ' ')), value, isLink: false });
-  }
+function toFieldClass(label: string): string {
+  return `precept-field-${label.toLowerCase().replace(/\s+/g, '-')}`;
 }
 
-function addCustomFieldRows(rows: MetadataRow[], options: Record<string, string>, config: PreceptConfig): void {
-  for (const [fieldName, fieldValues] of Object.entries(config.customFields)) {
-    if (options[fieldName]) {
-      const value = options[fieldName];
-      let displayValue = value;
-      for (const fv of fieldValues) {
-        if (fv.value === value) {
-          displayValue = fv.title;
-          break;
-        }
-      }
-      rows.push({ label: titleCase(fieldName.replace(/_/g, ' ')), value: displayValue, isLink: false });
-    }
-  }
+/**
+ * Render a plain-text metadata row, optionally wrapping the value in a styled span.
+ */
+function textRow(label: string, value: string, cssClass?: string): string {
+  const valueHtml = cssClass
+    ? `<span class="${cssClass}">${escapeHtml(value)}</span>`
+    : escapeHtml(value);
+  return metadataRowHtml(label, valueHtml);
+}
+
+/**
+ * Render a metadata row listing links to other items.
+ */
+function linkRow(label: string, ids: readonly string[]): string {
+  return metadataRowHtml(label, ids.map(linkRefHtml).join(', '));
+}
+
+function linkRefHtml(id: string): string {
+  return `<a href="#req-${escapeAttr(id)}" class="precept-link-ref">${escapeHtml(id)}</a>`;
 }
 
-function addIncomingLinkRows(rows: MetadataRow[], itemId: string, config: PreceptConfig, index?: RequirementIndex): void {
-  if (!index || !itemId) return;
+function metadataRowHtml(label: string, valueHtml: string): string {
+  return `<tr><td>${escapeHtml(label)}</td><td class="${getFieldClass(label)}">${valueHtml}</td></tr>`;
+}
+
+// ---------------------------------------------------------------------------
+// Incoming links
+// ---------------------------------------------------------------------------
+
+/** Link type -> IDs of the objects linking to one item, in index order */
+export type ItemIncomingLinks = ReadonlyMap<string, string[]>;
 
-  // Build incoming links from the linkGraph
-  // For each item that has a link TO this item, find what link type it is
-  const allObjects = index.objects;
-  const incoming: Record<string, string[]> = {};
+/** Target ID -> incoming links of that item */
+export type IncomingLinks = ReadonlyMap<string, ItemIncomingLinks>;
 
-  for (const [sourceId, sourceObj] of allObjects) {
-    if (sourceId === itemId) continue;
+/**
+ * Reverse link maps, built once per render context. The index is updated in
+ * place by the IndexBuilder, so the map is tied to the context (one document
+ * render) rather than to the index object itself.
+ */
+const incomingLinkIndexes = new WeakMap<RenderContext, IncomingLinks>();
 
-    for (const [linkType, targetIds] of Object.entries(sourceObj.links)) {
-      if (targetIds.includes(itemId)) {
-        if (!incoming[linkType]) {
-          incoming[linkType] = [];
+/**
+ * Get the incoming links of one item. Items without an ID and renders without
+ * indexed objects (e.g. a preview opened before the first workspace scan)
+ * return early, so they never build the reverse map.
+ */
+function getItemIncomingLinks(ctx: RenderContext, itemId: string): ItemIncomingLinks | undefined {
+  const { index } = ctx;
+  if (!itemId || !index || index.objects.size === 0) return undefined;
+
+  let incoming = ctx.incomingLinks ?? incomingLinkIndexes.get(ctx);
+  if (!incoming) {
+    incoming = buildIncomingLinks(index);
+    incomingLinkIndexes.set(ctx, incoming);
+  }
+  return incoming.get(itemId);
+}
+
+/**
+ * Invert the outgoing links of every indexed object in a single pass,
+ * so each directive looks up its incoming links instead of scanning the index.
+ */
+export function buildIncomingLinks(index: RequirementIndex): IncomingLinks {
+  const incoming = new Map<string, Map<string, string[]>>();
+
+  for (const [sourceId, sourceObj] of index.objects) {
+    const { links } = sourceObj;
+    // Iterate keys directly rather than materializing entry pairs per object
+    for (const linkType in links) {
+      for (const targetId of links[linkType]) {
+        if (targetId === sourceId) continue;
+
+        let byType = incoming.get(targetId);
+        if (!byType) {
+          byType = new Map();
+          incoming.set(targetId, byType);
+        }
+        let sourceIds = byType.get(linkType);
+        if (!sourceIds) {
+          sourceIds = [];
+          byType.set(linkType, sourceIds);
+        }
+        // A source listing the same target twice is still one incoming link
+        if (sourceIds[sourceIds.length - 1] !== sourceId) {
+          sourceIds.push(sourceId);
         }
-        incoming[linkType].push(sourceId);
       }
     }
   }
 
-  // Add incoming link rows
-  for (const [linkType, sourceIds] of Object.entries(incoming)) {
-    const incomingLabel = getIncomingLabel(config, linkType);
-    rows.push({
-      label: incomingLabel,
-      value: sourceIds.join(', '),
-      isLink: true,
-    });
-  }
+  return incoming;
 }
 
 // ---------------------------------------------------------------------------
-// Metadata table HTML rendering
+// Config lookup tables
 // ---------------------------------------------------------------------------
 
-function renderMetadataTable(rows: MetadataRow[]): string {
-  const parts: string[] = [];
-  parts.push('<div class="precept-metadata-wrapper">');
-  parts.push('<table class="precept-metadata-table">');
-  parts.push('<tbody>');
-
-  for (const row of rows) {
-    const fieldClass = `precept-field-${row.label.toLowerCase().replace(/\s+/g, '-')}`;
-    parts.push('<tr>');
-    parts.push(`<td>${escapeHtml(row.label)}</td>`);
-    parts.push(`<td class="${fieldClass}">`);
-
-    if (row.isLink && row.value) {
-      const ids = row.value.split(',').map(s => s.trim());
-      const links = ids.map(id =>
-        `<a href="#req-${escapeAttr(id)}" class="precept-link-ref">${escapeHtml(id)}</a>`
-      );
-      parts.push(links.join(', '));
-    } else if (row.cssClass) {
-      parts.push(`<span class="${row.cssClass}">${escapeHtml(row.value)}</span>`);
-    } else {
-      parts.push(escapeHtml(row.value));
+/**
+ * Lookup tables derived from a PreceptConfig, built once per config object.
+ */
+interface CompiledRenderConfig {
+  /** Outgoing link option -> display label, in config order */
+  linkLabels: ReadonlyMap<string, string>;
+  /** Link option -> display label for links pointing at the item */
+  incomingLabels: ReadonlyMap<string, string>;
+  /** Object type -> display title */
+  typeTitles: ReadonlyMap<string, string>;
+  /** Level -> display title */
+  levelTitles: ReadonlyMap<string, string>;
+  /** Custom field name -> (value -> display title), in config order */
+  customFieldTitles: ReadonlyMap<string, ReadonlyMap<string, string>>;
+}
+
+const compiledConfigs = new WeakMap<PreceptConfig, CompiledRenderConfig>();
+
+/**
+ * Get the lookup tables for a config, building them on first use.
+ * A reloaded config is a new object, so keying by identity invalidates the cache.
+ */
+function getCompiledConfig(config: PreceptConfig): CompiledRenderConfig {
+  let compiled = compiledConfigs.get(config);
+  if (!compiled) {
+    compiled = compileRenderConfig(config);
+    compiledConfigs.set(config, compiled);
+  }
+  return compiled;
+}
+
+function compileRenderConfig(config: PreceptConfig): CompiledRenderConfig {
+  const linkLabels = new Map<string, string>();
+  const incomingLabels = new Map<string, string>();
+
+  for (const lt of config.linkTypes) {
+    if (lt.option && !linkLabels.has(lt.option)) {
+      linkLabels.set(lt.option, humanize(lt.outgoing));
+    }
+    if (!incomingLabels.has(lt.option)) {
+      incomingLabels.set(lt.option, humanize(lt.incoming));
     }
+  }
 
-    parts.push('</td>');
-    parts.push('</tr>');
+  const typeTitles = new Map<string, string>();
+  for (const ot of config.objectTypes) {
+    if (!typeTitles.has(ot.type)) {
+      typeTitles.set(ot.type, ot.title || titleCase(ot.type));
+    }
   }
 
-  parts.push('</tbody>');
-  parts.push('</table>');
-  parts.push('</div>');
+  const levelTitles = new Map<string, string>();
+  for (const lv of config.levels) {
+    if (!levelTitles.has(lv.level)) {
+      levelTitles.set(lv.level, lv.title || titleCase(lv.level));
+    }
+  }
 
-  return parts.join('\n');
+  const customFieldTitles = new Map<string, ReadonlyMap<string, string>>();
+  for (const [fieldName, fieldValues] of Object.entries(config.customFields)) {
+    const valueTitles = new Map<string, string>();
+    for (const fv of fieldValues) {
+      if (!valueTitles.has(fv.value)) {
+        valueTitles.set(fv.value, fv.title);
+      }
+    }
+    customFieldTitles.set(fieldName, valueTitles);
+  }
+
+  return { linkLabels, incomingLabels, typeTitles, levelTitles, customFieldTitles };
 }
 
 // ---------------------------------------------------------------------------
 // Helpers
 // ---------------------------------------------------------------------------
 
-function getTypeTitle(config: PreceptConfig, itemType: string): string {
-  for (const ot of config.objectTypes) {
-    if (ot.type === itemType) {
-      return ot.title || titleCase(itemType);
-    }
-  }
-  return titleCase(itemType);
+function getTypeTitle(compiled: CompiledRenderConfig, itemType: string): string {
+  return compiled.typeTitles.get(itemType) ?? titleCase(itemType);
 }
 
-function getLevelTitle(config: PreceptConfig, level: string): string {
-  for (const lv of config.levels) {
-    if (lv.level === level) {
-      return lv.title || titleCase(level);
-    }
-  }
-  return titleCase(level);
+function getLevelTitle(compiled: CompiledRenderConfig, level: string): string {
+  return compiled.levelTitles.get(level) ?? titleCase(level);
 }
 
-function getIncomingLabel(config: PreceptConfig, linkType: string): string {
-  for (const lt of config.linkTypes) {
-    if (lt.option === linkType) {
-      return titleCase(lt.incoming.replace(/_/g, ' '));
+function getIncomingLabel(compiled: CompiledRenderConfig, linkType: string): string {
+  return compiled.incomingLabels.get(linkType) ?? humanize(`${linkType} (incoming)`);
+}
+
+/**
+ * Build the server image URL for a PlantUML diagram.
+ * The deflate + encode step is cached, since the live preview re-renders
+ * every diagram in the document on each edit.
+ */
+function getPlantUmlUrl(server: string, source: string): string {
+  const encoded = memoize(plantUmlEncodings, source, encodePlantUml);
+  return server.endsWith('/') ? `${server}${encoded}` : `${server}/${encoded}`;
+}
+
+/**
+ * Return the memoized value for `key`, computing it on a miss and evicting the
+ * oldest entry once the cache is full. Renders run one at a time on the
+ * extension host, so the shared caches need no further coordination.
+ */
+function memoize(cache: Map<string, string>, key: string, compute: (key: string) => string): string {
+  let value = cache.get(key);
+  if (value === undefined) {
+    value = compute(key);
+    if (cache.size >= MEMO_CACHE_LIMIT) {
+      const oldest = cache.keys().next();
+      if (!oldest.done) {
+        cache.delete(oldest.value);
+      }
     }
+    cache.set(key, value);
   }
-  return titleCase(`${linkType} (incoming)`.replace(/_/g, ' '));
+  return value;
+}
+
+/** Row labels for option, field and link names, keyed by the raw name */
+const nameLabels = new Map<string, string>();
+
+/**
+ * Turn an option or field name such as `satisfied_by` into a row label
+ * ("Satisfied By"). The same few names recur on every item, so results are memoized.
+ */
+function humanize(name: string): string {
+  return memoize(nameLabels, name, toLabel);
+}
+
+function toLabel(name: string): string {
+  return titleCase(name.replace(/_/g, ' '));
 }
 
+const WORD_START_PATTERN = /\b\w/g;
+
 function titleCase(str: string): string {
-  return str.replace(/\b\w/g, c => c.toUpperCase());
+  return str.replace(WORD_START_PATTERN, toUpperCase);
+}
+
+function toUpperCase(char: string): string {
+  return char.toUpperCase();
+}
+
+type Highlighter = typeof hljsApi;
+
+let highlighter: Highlighter | undefined;
+
+/**
+ * Load highlight.js on first use. It registers every bundled language grammar
+ * at import time, and the renderer is imported during extension activation, so
+ * deferring it keeps that cost off startup until a code block is rendered.
+ */
+function getHighlighter(): Highlighter {
+  if (!highlighter) {
+    // eslint-disable-next-line @typescript-eslint/no-var-requires
+    const mod = require('highlight.js');
+    highlighter = (mod.default ?? mod) as Highlighter;
+  }
+  return highlighter;
 }
 
 /**
@@ -443,15 +678,26 @@ function titleCase(str: string): string {
  * Falls back to escaped plain text if the language is unknown.
  */
 export function highlightCode(code: string, language?: string): string {
+  if (!language || language === 'text') {
+    return `<pre><code>${escapeHtml(code)}</code></pre>`;
+  }
+  // The preview re-renders on every edit; only changed blocks need highlighting again.
+  // Language names are single-line option values, so the first newline ends the language.
+  return memoize(highlightedCode, `${language}\n${code}`, highlightCacheKey);
+}
+
+function highlightCacheKey(key: string): string {
+  const separator = key.indexOf('\n');
+  return highlightWithGrammar(key.slice(separator + 1), key.slice(0, separator));
+}
+
+function highlightWithGrammar(code: string, language: string): string {
   try {
-    if (language && language !== 'text' && hljs.getLanguage(language)) {
+    const hljs = getHighlighter();
+    if (hljs.getLanguage(language)) {
       const result = hljs.highlight(code, { language });
       return `<pre><code class="hljs language-${escapeAttr(language)}">${result.value}</code></pre>`;
     }
-    // Auto-detect or plain
-    if (!language || language === 'text') {
-      return `<pre><code>${escapeHtml(code)}</code></pre>`;
-    }
     // Language not recognized — try auto-detect
     const result = hljs.highlightAuto(code);
     return `<pre><code class="hljs">${result.value}</code></pre>`;
@@ -460,19 +706,24 @@ export function highlightCode(code: string, language?: string): string {
   }
 }
 
+const HTML_ESCAPES: Record<string, string> = {
+  '&': '&amp;',
+  '<': '&lt;',
+  '>': '&gt;',
+  '"': '&quot;',
+  "'": '&#39;',
+};
+const HTML_ESCAPE_PATTERN = /[&<>"]/g;
+const ATTR_ESCAPE_PATTERN = /[&<>"']/g;
+
+function escapeChar(ch: string): string {
+  return HTML_ESCAPES[ch];
+}
+
 export function escapeHtml(text: string): string {
-  return text
-    .replace(/&/g, '&amp;')
-    .replace(/</g, '&lt;')
-    .replace(/>/g, '&gt;')
-    .replace(/"/g, '&quot;');
+  return text.replace(HTML_ESCAPE_PATTERN, escapeChar);
 }
 
 export function escapeAttr(text: string): string {
-  return text
-    .replace(/&/g, '&amp;')
-    .replace(/"/g, '&quot;')
-    .replace(/'/g, '&#39;')
-    .replace(/</g, '&lt;')
-    .replace(/>/g, '&gt;');
+  return text.replace(ATTR_ESCAPE_PATTERN, escapeChar);
 }
@@ -30,6 +30,9 @@ export function renderDocument(doc: RstDocument, ctx: RenderContext): string {
  * Render an array of block nodes to HTML.
  */
 export function renderBlockNodes(nodes: BlockNode[], ctx: RenderContext): string {
+  // Empty and single-node bodies are the common case for item content
+  if (nodes.length === 0) return '';
+  if (nodes.length === 1) return renderBlockNode(nodes[0], ctx);
   return nodes.map(node => renderBlockNode(node, ctx)).join('\n');
 }
 
@@ -213,6 +216,9 @@ function renderTable(node: BlockNode & { type: 'table' }, ctx: RenderContext): s
  * Render inline nodes to HTML.
  */
 export function renderInlineNodes(nodes: InlineNode[], ctx: RenderContext): string {
+  // Most paragraphs and titles are a single text node
+  if (nodes.length === 0) return '';
+  if (nodes.length === 1) return renderInlineNode(nodes[0], ctx);
   return nodes.map(node => renderInlineNode(node, ctx)).join('');
 }
 
@@ -15,16 +15,20 @@ export {
   renderItemDirective,
   renderGraphicDirective,
   renderListingDirective,
+  buildIncomingLinks,
   highlightCode,
   escapeHtml,
   escapeAttr,
   type RenderContext,
+  type IncomingLinks,
+  type ItemIncomingLinks,
 } from './directiveRenderer';
 
 // PlantUML
 export {
   renderPlantUml,
   encodePlantUml,
+  isPlantUmlSource,
   plantUmlFallbackHtml,
   type PlantUmlConfig,
 } from './plantumlRenderer';
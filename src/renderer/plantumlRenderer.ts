@@ -17,12 +17,22 @@ export interface PlantUmlConfig {
   server: string;    // e.g. 'https://www.plantuml.com/plantuml/svg/'
 }
 
+/** Opening tag of the diagram kinds rendered through PlantUML */
+const PLANTUML_START_PATTERN = /@start(?:uml|mindmap|gantt)/;
+
 const DEFAULT_CONFIG: PlantUmlConfig = {
   mode: 'local',
   command: 'plantuml',
   server: 'https://www.plantuml.com/plantuml/svg/',
 };
 
+/**
+ * Check whether text contains a PlantUML diagram (@startuml, @startmindmap, @startgantt).
+ */
+export function isPlantUmlSource(text: string): boolean {
+  return PLANTUML_START_PATTERN.test(text);
+}
+
 /**
  * Render PlantUML source text to SVG.
  *
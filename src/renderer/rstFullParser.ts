@@ -33,6 +33,7 @@ import {
   InlineNode,
 } from './rstNodes';
 import { parseInline } from './inlineParser';
+import { isPlantUmlSource } from './plantumlRenderer';
 
 // Section underline characters in RST
 const SECTION_CHARS = new Set(['=', '-', '~', '^', '"', '#', '*', '+', '`', '_']);
@@ -508,7 +509,10 @@ function createGraphicDirectiveNode(
   options: Record<string, string>,
   contentLines: string[]
 ): GraphicDirectiveNode {
-  const contentNodes = contentLines.length > 0 && !isPlantUml(contentLines)
+  // An image file takes precedence over the body, which is then never rendered
+  const hasBody = !options.file && contentLines.length > 0;
+  const plantuml = hasBody && isPlantUml(contentLines);
+  const contentNodes = hasBody && !plantuml
     ? parseBlocks(contentLines, 0, 0)
     : [];
 
@@ -524,6 +528,7 @@ function createGraphicDirectiveNode(
     caption: options.caption || '',
     options,
     content: contentLines,
+    plantuml,
     contentNodes,
   };
 }
@@ -1037,8 +1042,8 @@ function isTransition(line: string, lines: string[], i: number): boolean {
 }
 
 function isPlantUml(contentLines: string[]): boolean {
-  const text = contentLines.join('\n');
-  return text.includes('@startuml') || text.includes('@startmindmap') || text.includes('@startgantt');
+  // The @start tag never spans lines, so test line by line instead of joining
+  return contentLines.some(isPlantUmlSource);
 }
 
 function slugify(text: string): string {
@@ -198,6 +198,7 @@ export interface GraphicDirectiveNode {
   caption: string;
   options: Record<string, string>;
   content: string[];                // PlantUML source lines or other content
+  plantuml: boolean;                // content is a PlantUML diagram (detected while parsing)
   contentNodes: BlockNode[];
 }
 